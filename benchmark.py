@@ -0,0 +1,140 @@
+"""Scaling benchmark for deck loading and the deck-wide FlashcardApp operations.
+
+Generates synthetic decks of each size, then measures QuestionLoader load
+time, flashcard construction, shuffle_cards, review-mode switching and peak
+traced memory. Exits with status 1 if any measurement exceeds its budget.
+
+    python benchmark.py --sizes 1000 10000 100000 1000000
+"""
+import os
+import sys
+import time
+import argparse
+import tempfile
+import tracemalloc
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+from flashcards import FlashcardApp, QuestionLoader, FlipState
+from generate_deck import DISTRIBUTIONS, generate_deck, write_deck
+
+DEFAULT_SIZES = (1000, 10000, 100000, 1000000)
+
+# Budgets are a fixed allowance plus a per-card cost: (seconds or bytes, per card)
+BUDGETS = {
+    'load': (0.05, 20e-6),
+    'construct': (0.05, 10e-6),
+    'shuffle': (0.01, 2e-6),
+    'review': (0.01, 1e-6),
+    'peak_memory': (1024 * 1024, 3 * 1024),
+}
+
+# Cards marked incorrect before timing review-mode switching
+MAX_REVIEW_CARDS = 1000
+
+def budget_for(name, num_cards, scale):
+    base, per_card = BUDGETS[name]
+    return (base + per_card * num_cards) * scale
+
+def best_of(func, repeat=3):
+    """Smallest wall time of several runs of func()"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def install_deck(app, cards):
+    """Point an existing app at a new deck, resetting scores and position"""
+    app.flashcards = cards
+    app.original_flashcards = cards.copy()
+    app.cards_by_id = {card.card_id: card for card in cards if card.card_id is not None}
+    app.current_index = 0
+    app.current_card = cards[0] if cards else None
+    app.correct_answers = 0
+    app.incorrect_answers = 0
+    app.incorrect_cards = []
+    app.answered_cards = set()
+    app.review_mode = False
+
+def build_cards(app, loader):
+    deck_dir = os.path.dirname(os.path.abspath(loader.json_file))
+    return [app.create_flashcard(q, deck_dir) for q in loader.questions]
+
+def measure(app, path, num_cards):
+    results = {}
+
+    start = time.perf_counter()
+    loader = QuestionLoader(path)
+    results['load'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    cards = build_cards(app, loader)
+    results['construct'] = time.perf_counter() - start
+    del loader
+
+    install_deck(app, cards)
+    results['shuffle'] = best_of(app.shuffle_cards)
+
+    # Answer the first cards wrong, then time a round trip into review mode and back
+    for _ in range(min(num_cards // 10, MAX_REVIEW_CARDS)):
+        app.current_card.flip_state = FlipState.IDLE
+        app.mark_incorrect()
+
+    def switch_review():
+        app.start_review_mode()
+        app.back_to_all_cards()
+    results['review'] = best_of(switch_review)
+    del cards
+    install_deck(app, [])
+
+    # Separate pass: tracemalloc slows allocation-heavy code, so keep it out of the timings
+    tracemalloc.start()
+    loader = QuestionLoader(path)
+    cards = build_cards(app, loader)
+    results['peak_memory'] = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    del loader, cards
+    return results
+
+def format_value(name, value):
+    if name == 'peak_memory':
+        return f"{value / (1024 * 1024):.1f} MB"
+    return f"{value * 1000:.1f} ms"
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark deck operations against size budgets")
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES)
+    parser.add_argument('--distribution', choices=DISTRIBUTIONS, default='geometric')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--budget-scale', type=float, default=1.0,
+                        help="multiply every budget, e.g. 2.0 on slow machines")
+    args = parser.parse_args()
+
+    app = FlashcardApp()
+    failures = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for num_cards in args.sizes:
+            path = os.path.join(tmp_dir, f"deck_{num_cards}.json")
+            write_deck(path, generate_deck(num_cards, args.distribution, seed=args.seed))
+            results = measure(app, path, num_cards)
+            os.remove(path)
+
+            print(f"\n{num_cards} cards")
+            for name, value in results.items():
+                budget = budget_for(name, num_cards, args.budget_scale)
+                status = "ok" if value <= budget else "OVER BUDGET"
+                print(f"  {name:<12} {format_value(name, value):>12}  "
+                      f"(budget {format_value(name, budget)})  {status}")
+                if value > budget:
+                    failures.append((num_cards, name))
+
+    if failures:
+        print(f"\n{len(failures)} measurement(s) over budget")
+        sys.exit(1)
+    print("\nAll measurements within budget")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+import os
+import json
+import time
+
+# Seconds between checks of the deck file
+POLL_INTERVAL = 0.5
+
+def index_entries(questions):
+    """Map stable id -> deck entry; entries without an id can't be diffed and are skipped"""
+    return {q['id']: q for q in questions if 'id' in q}
+
+def duplicate_ids(questions):
+    """Ids used by more than one entry, in file order"""
+    seen = set()
+    duplicates = []
+    for q in questions:
+        if 'id' in q:
+            if q['id'] in seen and q['id'] not in duplicates:
+                duplicates.append(q['id'])
+            seen.add(q['id'])
+    return duplicates
+
+def entry_problem(entry):
+    """Describe why a deck entry can't be applied to the live deck, or None if it's fine"""
+    if not isinstance(entry, dict):
+        return f"expected an object, got {type(entry).__name__}"
+    # An id is optional (such entries are skipped), but it must be usable as a key
+    if 'id' in entry:
+        try:
+            hash(entry['id'])
+        except TypeError:
+            return f"'id' {entry['id']!r} is not a valid key"
+    for key in ('question', 'answer'):
+        if not isinstance(entry.get(key), str):
+            return f"no '{key}' text"
+    for key in ('question_image', 'answer_image'):
+        if entry.get(key) and not isinstance(entry[key], str):
+            return f"non-text '{key}'"
+    return None
+
+class DeckChanges:
+    """Entries added, updated or removed between two versions of a deck, keyed by id"""
+    def __init__(self, added, updated, removed):
+        self.added = added        # New entries, in file order
+        self.updated = updated    # id -> new entry
+        self.removed = removed    # ids no longer in the deck
+
+    def __bool__(self):
+        return bool(self.added or self.updated or self.removed)
+
+    def __repr__(self):
+        return (f"DeckChanges(added={len(self.added)}, updated={len(self.updated)}, "
+                f"removed={len(self.removed)})")
+
+def diff_entries(old_entries, new_entries):
+    """Compare two id-indexed decks entry by entry"""
+    added = [entry for card_id, entry in new_entries.items() if card_id not in old_entries]
+    updated = {card_id: entry for card_id, entry in new_entries.items()
+               if card_id in old_entries and old_entries[card_id] != entry}
+    removed = {card_id for card_id in old_entries if card_id not in new_entries}
+    return DeckChanges(added, updated, removed)
+
+class DeckWatcher:
+    """Poll a deck file and report what changed since the last good version.
+
+    Only the file's mtime and size are checked between edits. When they
+    change the file is re-read; an unchanged payload, a half-saved,
+    unparseable file, or one with incomplete entries or duplicate ids is
+    ignored and the live deck keeps its last good state. Entries without an
+    id load at startup but are never updated, added or removed by a reload.
+    """
+    def __init__(self, path, questions, poll_interval=POLL_INTERVAL):
+        self.path = path
+        self.poll_interval = poll_interval
+        self.entries = index_entries(questions)
+        duplicates = duplicate_ids(questions)
+        if duplicates:
+            print(f"Duplicate ids in {path}: {duplicates}; changes will be ignored until they are unique")
+        self.last_check = time.monotonic()
+        self.signature = self.get_signature()
+        self.content = None
+
+    def get_signature(self):
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def poll(self):
+        """Return DeckChanges if the deck file changed, otherwise None"""
+        now = time.monotonic()
+        if now - self.last_check < self.poll_interval:
+            return None
+        self.last_check = now
+
+        signature = self.get_signature()
+        if signature is None or signature == self.signature:
+            return None
+        self.signature = signature
+
+        try:
+            with open(self.path, 'r', encoding='utf-8') as file:
+                content = file.read()
+        except OSError as e:
+            print(f"Error reading {self.path}: {e}")
+            return None
+        if content == self.content:
+            return None
+
+        try:
+            questions = json.loads(content).get('questions', [])
+        except (json.JSONDecodeError, AttributeError) as e:
+            print(f"Ignoring change to {self.path}, could not parse it: {e}")
+            return None
+        if not isinstance(questions, list):
+            print(f"Ignoring change to {self.path}, 'questions' is not a list")
+            return None
+        for position, entry in enumerate(questions):
+            problem = entry_problem(entry)
+            if problem:
+                print(f"Ignoring change to {self.path}, entry {position + 1}: {problem}")
+                return None
+        duplicates = duplicate_ids(questions)
+        if duplicates:
+            print(f"Ignoring change to {self.path}, duplicate ids: {duplicates}")
+            return None
+        self.content = content
+
+        new_entries = index_entries(questions)
+        changes = diff_entries(self.entries, new_entries)
+        self.entries = new_entries
+        return changes if changes else None
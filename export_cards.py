@@ -0,0 +1,148 @@
+"""Headless export of every card face to PNG, optionally tiled onto printable sheets.
+
+Cards are rendered with FlashcardApp.draw_card, so exported cards match the
+app's formatting exactly. The deck is split into chunks that run on a
+process pool; each worker owns its own SDL context on the dummy video driver.
+
+    python export_cards.py questions.json -o export --sheets --grid 2x4
+"""
+import os
+import re
+import sys
+import time
+import argparse
+import multiprocessing
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+# SDL otherwise turns SIGTERM into a quit event, and Pool.terminate() waits forever
+os.environ.setdefault('SDL_NO_SIGNAL_HANDLERS', '1')
+
+import pygame
+from flashcards import FlashcardApp, QuestionLoader, FlipState
+from images import fit_size
+
+# A4 at 150 DPI
+SHEET_SIZE = (1240, 1754)
+SHEET_MARGIN = 60
+CARD_PADDING = 20  # Background kept around the card, enough for its shadow
+DEFAULT_CHUNK_SIZE = 32
+FACES = ((False, 'question'), (True, 'answer'))
+
+# Per-process app, created once by init_worker
+_worker_app = None
+
+def init_worker(deck_path):
+    global _worker_app
+    _worker_app = FlashcardApp(deck_path)
+    _worker_app.show_card_hints = False
+
+def card_file_name(card_id, position):
+    """File stem for a card: its row in the deck file, so names stay unique, plus its id.
+
+    Integer ids are zero-padded; any other id is used as text with characters
+    that aren't safe in file names replaced.
+    """
+    name = f"card_{position + 1:05d}"
+    if isinstance(card_id, int) and not isinstance(card_id, bool):
+        return f"{name}_{card_id:05d}"
+    if card_id is not None:
+        return f"{name}_{re.sub(r'[^A-Za-z0-9_.-]', '_', str(card_id))}"
+    return name
+
+def render_face(app, card, showing_answer):
+    """Draw one face through draw_card and return a copy of the card area"""
+    card.showing_answer = showing_answer
+    card.flip_state = FlipState.IDLE
+    app.current_card = card
+    app.draw_background()
+    app.draw_card()
+    export_rect = app.card_rect.inflate(2 * CARD_PADDING, 2 * CARD_PADDING)
+    return app.screen.subsurface(export_rect).copy()
+
+def tile_sheet(surfaces, columns, rows, mirror=False):
+    """Lay card images out on a white sheet; mirrored sheets line up as duplex backs"""
+    sheet = pygame.Surface(SHEET_SIZE)
+    sheet.fill((255, 255, 255))
+    cell_width = (SHEET_SIZE[0] - 2 * SHEET_MARGIN) // columns
+    cell_height = (SHEET_SIZE[1] - 2 * SHEET_MARGIN) // rows
+    for i, surface in enumerate(surfaces):
+        row, column = divmod(i, columns)
+        if mirror:
+            column = columns - 1 - column
+        image = pygame.transform.smoothscale(surface, fit_size(surface.get_size(), (cell_width, cell_height)))
+        cell = pygame.Rect(SHEET_MARGIN + column * cell_width, SHEET_MARGIN + row * cell_height,
+                           cell_width, cell_height)
+        sheet.blit(image, image.get_rect(center=cell.center))
+    return sheet
+
+def export_chunk(task):
+    """Render cards [start, end) of the deck file; tile them if a grid is given"""
+    chunk_index, start, end, output_dir, grid = task
+    app = _worker_app
+    image_box = app.get_image_box()
+    sheet_faces = {False: [], True: []}
+
+    for position in range(start, end):
+        question = app.loader.questions[position]
+        card = app.create_flashcard(question, app.deck_dir)
+        # Figures must be ready before drawing; there are no later frames to pick them up
+        for path in card.get_images():
+            app.image_cache.load(path, image_box)
+
+        name = card_file_name(card.card_id, position)
+        for showing_answer, face in FACES:
+            surface = render_face(app, card, showing_answer)
+            pygame.image.save(surface, os.path.join(output_dir, 'cards', f"{name}_{face}.png"))
+            if grid:
+                sheet_faces[showing_answer].append(surface)
+
+    if grid:
+        columns, rows = grid
+        for showing_answer, face in FACES:
+            sheet = tile_sheet(sheet_faces[showing_answer], columns, rows, mirror=showing_answer)
+            pygame.image.save(sheet, os.path.join(output_dir, 'sheets', f"sheet_{chunk_index + 1:04d}_{face}.png"))
+    return end - start
+
+def parse_grid(value):
+    try:
+        columns, rows = (int(n) for n in value.lower().split('x'))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"grid must look like 2x4, got {value!r}")
+    if columns <= 0 or rows <= 0:
+        raise argparse.ArgumentTypeError("grid dimensions must be positive")
+    return columns, rows
+
+def main():
+    parser = argparse.ArgumentParser(description="Export every card face to PNG")
+    parser.add_argument('deck', nargs='?', default='questions.json')
+    parser.add_argument('-o', '--output', default='export')
+    parser.add_argument('--sheets', action='store_true', help="also tile cards onto printable sheets")
+    parser.add_argument('--grid', type=parse_grid, default=(2, 4), help="sheet columns x rows (default: 2x4)")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    num_cards = len(QuestionLoader(args.deck).questions)
+    if not num_cards:
+        print("No questions found in the JSON file!")
+        sys.exit(1)
+
+    os.makedirs(os.path.join(args.output, 'cards'), exist_ok=True)
+    grid = args.grid if args.sheets else None
+    if grid:
+        os.makedirs(os.path.join(args.output, 'sheets'), exist_ok=True)
+    # With sheets, one chunk fills exactly one sheet
+    chunk_size = grid[0] * grid[1] if grid else DEFAULT_CHUNK_SIZE
+    tasks = [(i, start, min(start + chunk_size, num_cards), args.output, grid)
+             for i, start in enumerate(range(0, num_cards, chunk_size))]
+
+    start_time = time.perf_counter()
+    # Spawned workers start from a clean interpreter, so each gets its own SDL context
+    context = multiprocessing.get_context('spawn')
+    with context.Pool(args.workers, initializer=init_worker, initargs=(args.deck,)) as pool:
+        exported = sum(pool.imap_unordered(export_chunk, tasks))
+    elapsed = time.perf_counter() - start_time
+    print(f"Exported {exported} cards to {args.output} in {elapsed:.1f}s with {args.workers} workers")
+
+if __name__ == "__main__":
+    main()
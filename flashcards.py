@@ -3,7 +3,11 @@ import json
 import random
 import math
 import sys
+import os
 from enum import Enum
+from surfaces import gradient_surface, rounded_fill, blit_rounded_shadow
+from images import ImageCache
+from deck_watcher import DeckWatcher
 
 # Initialize Pygame
 pygame.init()
@@ -12,6 +16,8 @@ pygame.init()
 SCREEN_WIDTH = 1200
 SCREEN_HEIGHT = 800
 FPS = 60
+IMAGE_AREA_RATIO = 0.6  # Share of the card content height given to a figure
+IMAGE_PREFETCH_AHEAD = 2  # Upcoming cards whose figures are decoded in advance
 
 # Modern Color Palette
 COLORS = {
@@ -76,14 +82,26 @@ class QuestionLoader:
             sys.exit(1)
 
 class AnimatedFlashcard:
-    def __init__(self, question, answer):
+    def __init__(self, question, answer, question_image=None, answer_image=None, card_id=None):
+        self.card_id = card_id
         self.question = question
         self.answer = answer
+        self.question_image = question_image
+        self.answer_image = answer_image
         self.showing_answer = False
         self.flip_state = FlipState.IDLE
         self.flip_progress = 0.0
         self.flip_speed = 8.0
+        self.layout_cache = {}  # (showing_answer, content_width) -> wrapped lines
         
+    def update_content(self, question, answer, question_image=None, answer_image=None):
+        """Replace the card's text and figures in place, keeping its identity and state"""
+        self.question = question
+        self.answer = answer
+        self.question_image = question_image
+        self.answer_image = answer_image
+        self.layout_cache.clear()
+    
     def start_flip(self):
         """Start the flip animation"""
         if self.flip_state == FlipState.IDLE:
@@ -106,6 +124,12 @@ class AnimatedFlashcard:
     def get_current_text(self):
         return self.answer if self.showing_answer else self.question
     
+    def get_current_image(self):
+        return self.answer_image if self.showing_answer else self.question_image
+    
+    def get_images(self):
+        return [path for path in (self.question_image, self.answer_image) if path]
+    
     def get_scale_x(self):
         """Get horizontal scale for flip animation"""
         if self.flip_state == FlipState.IDLE:
@@ -122,67 +146,151 @@ class AnimatedFlashcard:
         """Determine if we should show the back side during animation"""
         return self.flip_progress > 0.5
 
-class ModernButton:
-    def __init__(self, x, y, width, height, text, color, hover_color, text_color=None):
-        self.rect = pygame.Rect(x, y, width, height)
+class Widget:
+    """Base class for retained-mode UI elements.
+
+    A widget owns its rect and any pre-rendered surfaces; the per-frame
+    work is limited to picking which cached surface to blit.
+    """
+    def __init__(self, rect, on_click=None):
+        self.rect = pygame.Rect(rect)
+        self.on_click = on_click
+        self.visible = True
+        self.enabled = True
+    
+    def hit_test(self, pos):
+        """Return True if this widget should receive a click at pos"""
+        return self.visible and self.enabled and self.rect.collidepoint(pos)
+    
+    def update(self, mouse_pos, mouse_pressed):
+        pass
+    
+    def draw(self, screen):
+        pass
+
+class WidgetGroup:
+    """Ordered collection of widgets with a single click dispatcher.
+
+    Widgets are drawn in insertion order; clicks go to the first widget
+    (in insertion order) whose hit_test accepts the position.
+    """
+    def __init__(self):
+        self.widgets = []
+    
+    def add(self, widget):
+        self.widgets.append(widget)
+        return widget
+    
+    def update(self, mouse_pos, mouse_pressed):
+        for widget in self.widgets:
+            if widget.visible and widget.enabled:
+                widget.update(mouse_pos, mouse_pressed)
+            else:
+                widget.update((-1, -1), False)
+    
+    def draw(self, screen):
+        for widget in self.widgets:
+            if widget.visible:
+                widget.draw(screen)
+    
+    def dispatch_click(self, pos):
+        """Invoke the on_click of the widget under pos; return True if handled"""
+        for widget in self.widgets:
+            if widget.hit_test(pos):
+                if widget.on_click:
+                    widget.on_click()
+                return True
+        return False
+
+class ModernButton(Widget):
+    DISABLED_COLOR = (100, 100, 100)
+    DISABLED_TEXT_COLOR = (150, 150, 150)
+    SHADOW_OFFSET = 4
+    PRESS_OFFSET = 2
+    
+    def __init__(self, x, y, width, height, text, color, hover_color, text_color=None, on_click=None):
+        super().__init__((x, y, width, height), on_click)
         self.text = text
         self.color = color
         self.hover_color = hover_color
         self.text_color = text_color or COLORS['text_white']
         self.is_hovered = False
         self.is_pressed = False
-        
-    def update(self, mouse_pos, mouse_pressed):
-        self.is_hovered = self.rect.collidepoint(mouse_pos)
-        self.is_pressed = self.is_hovered and mouse_pressed
-        
-    def draw(self, screen):
-        current_color = self.hover_color if self.is_hovered else self.color
-        
-        # Draw shadow
-        shadow_rect = self.rect.copy()
-        shadow_rect.y += 4
-        pygame.draw.rect(screen, (0, 0, 0, 30), shadow_rect, border_radius=12)
-        
-        # Draw button
-        if self.is_pressed:
-            button_rect = self.rect.copy()
-            button_rect.y += 2
-        else:
-            button_rect = self.rect
-            
-        pygame.draw.rect(screen, current_color, button_rect, border_radius=12)
-        
-        # Draw text with proper scaling to fit
-        text_surface = font_medium.render(self.text, True, self.text_color)
+        self.state_surfaces = self.render_states()
+    
+    def render_label(self, text_color):
+        """Render the label once, scaled down if it's too wide for the button"""
+        text_surface = font_medium.render(self.text, True, text_color)
         text_rect = text_surface.get_rect()
         
-        # Scale text if it's too wide for the button
-        max_width = button_rect.width - 10  # 5px padding on each side
+        max_width = self.rect.width - 10  # 5px padding on each side
         if text_rect.width > max_width:
             scale_factor = max_width / text_rect.width
             new_width = int(text_rect.width * scale_factor)
             new_height = int(text_rect.height * scale_factor)
             if new_width > 0 and new_height > 0:
                 text_surface = pygame.transform.scale(text_surface, (new_width, new_height))
+        return text_surface
+    
+    def render_state(self, color, label, offset_y):
+        """Pre-render shadow, body and label for one visual state"""
+        width, height = self.rect.size
+        surface = pygame.Surface((width, height + self.SHADOW_OFFSET), pygame.SRCALPHA)
+        
+        # Shadow is opaque black, matching what the old direct-to-screen draw produced
+        shadow_rect = pygame.Rect(0, self.SHADOW_OFFSET, width, height)
+        pygame.draw.rect(surface, (0, 0, 0), shadow_rect, border_radius=12)
+        
+        body_rect = pygame.Rect(0, offset_y, width, height)
+        pygame.draw.rect(surface, color, body_rect, border_radius=12)
+        surface.blit(label, label.get_rect(center=body_rect.center))
+        return surface
+    
+    def render_states(self):
+        """Build the normal, hover, pressed and disabled surfaces"""
+        label = self.render_label(self.text_color)
+        disabled_label = self.render_label(self.DISABLED_TEXT_COLOR)
+        return {
+            'normal': self.render_state(self.color, label, 0),
+            'hover': self.render_state(self.hover_color, label, 0),
+            'pressed': self.render_state(self.hover_color, label, self.PRESS_OFFSET),
+            'disabled': self.render_state(self.DISABLED_COLOR, disabled_label, 0),
+        }
+    
+    def get_state(self):
+        if not self.enabled:
+            return 'disabled'
+        if self.is_pressed:
+            return 'pressed'
+        if self.is_hovered:
+            return 'hover'
+        return 'normal'
+    
+    def update(self, mouse_pos, mouse_pressed):
+        self.is_hovered = self.rect.collidepoint(mouse_pos)
+        self.is_pressed = self.is_hovered and mouse_pressed
         
-        text_rect = text_surface.get_rect(center=button_rect.center)
-        screen.blit(text_surface, text_rect)
+    def draw(self, screen):
+        screen.blit(self.state_surfaces[self.get_state()], self.rect.topleft)
 
 class FlashcardApp:
-    def __init__(self):
+    def __init__(self, json_file='questions.json'):
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         pygame.display.set_caption("SE Forms Questions - Modern Flashcards")
         self.clock = pygame.time.Clock()
         
         # Load questions
-        self.loader = QuestionLoader('questions.json')
+        self.loader = QuestionLoader(json_file)
         if not self.loader.questions:
             print("No questions found in the JSON file!")
             sys.exit(1)
         
-        # Create flashcards
-        self.flashcards = [AnimatedFlashcard(q['question'], q['answer']) for q in self.loader.questions]
+        # Create flashcards (figure paths are relative to the deck file)
+        deck_dir = os.path.dirname(os.path.abspath(self.loader.json_file))
+        self.flashcards = [self.create_flashcard(q, deck_dir) for q in self.loader.questions]
+        self.image_cache = ImageCache()
+        self.deck_dir = deck_dir
+        self.deck_watcher = DeckWatcher(self.loader.json_file, self.loader.questions)
         random.shuffle(self.flashcards)
         
         self.current_index = 0
@@ -195,6 +303,7 @@ class FlashcardApp:
         self.answered_cards = set()  # Track which cards have been answered
         self.review_mode = False  # Whether we're reviewing incorrect answers
         self.original_flashcards = self.flashcards.copy()  # Keep original set
+        self.cards_by_id = {card.card_id: card for card in self.flashcards if card.card_id is not None}
         
         # UI elements
         self.card_rect = pygame.Rect(150, 150, SCREEN_WIDTH - 300, SCREEN_HEIGHT - 400)
@@ -205,43 +314,144 @@ class FlashcardApp:
         
         # Navigation buttons
         self.prev_button = ModernButton(50, button_y, 100, 40, "Previous", 
-                                       COLORS['accent'], COLORS['accent_hover'])
+                                       COLORS['accent'], COLORS['accent_hover'],
+                                       on_click=self.prev_card)
         self.next_button = ModernButton(SCREEN_WIDTH - 150, button_y, 100, 40, "Next", 
-                                       COLORS['accent'], COLORS['accent_hover'])
+                                       COLORS['accent'], COLORS['accent_hover'],
+                                       on_click=self.next_card)
         self.shuffle_button = ModernButton(SCREEN_WIDTH // 2 - 50, button_y, 100, 40, "Shuffle", 
-                                         COLORS['success'], COLORS['success_hover'])
+                                         COLORS['success'], COLORS['success_hover'],
+                                         on_click=self.shuffle_cards)
         
         # Scoring buttons
         self.correct_button = ModernButton(200, score_button_y, 110, 40, "Correct", 
-                                         COLORS['success'], COLORS['success_hover'])
+                                         COLORS['success'], COLORS['success_hover'],
+                                         on_click=self.mark_correct)
         self.incorrect_button = ModernButton(320, score_button_y, 110, 40, "Incorrect", 
-                                           (200, 50, 50), (220, 70, 70))
+                                           (200, 50, 50), (220, 70, 70),
+                                           on_click=self.mark_incorrect)
         self.review_button = ModernButton(440, score_button_y, 150, 40, "Review Wrong", 
-                                        (150, 100, 200), (170, 120, 220))
+                                        (150, 100, 200), (170, 120, 220),
+                                        on_click=self.start_review_mode)
         self.back_to_all_button = ModernButton(600, score_button_y, 130, 40, "Back to All", 
-                                             COLORS['accent'], COLORS['accent_hover'])
+                                             COLORS['accent'], COLORS['accent_hover'],
+                                             on_click=self.back_to_all_cards)
+        
+        # Widget layer: the card is a click target only, it draws itself in draw_card
+        self.widgets = WidgetGroup()
+        self.widgets.add(Widget(self.card_rect, on_click=self.flip_current_card))
+        for button in (self.prev_button, self.next_button, self.shuffle_button,
+                       self.correct_button, self.incorrect_button,
+                       self.review_button, self.back_to_all_button):
+            self.widgets.add(button)
         
         self.mouse_pos = (0, 0)
         self.mouse_pressed = False
-        
-    def create_gradient_surface(self, width, height, color1, color2, vertical=True):
-        """Create a gradient surface"""
-        gradient = pygame.Surface((width, height))
-        if vertical:
-            for y in range(height):
-                ratio = y / height
-                r = int(color1[0] * (1 - ratio) + color2[0] * ratio)
-                g = int(color1[1] * (1 - ratio) + color2[1] * ratio)
-                b = int(color1[2] * (1 - ratio) + color2[2] * ratio)
-                pygame.draw.line(gradient, (r, g, b), (0, y), (width, y))
+        self.show_card_hints = True  # Turned off for printed/exported cards
+        
+    def resolve_images(self, question, deck_dir):
+        """Absolute figure paths for a deck entry, keyed like AnimatedFlashcard's arguments"""
+        images = {}
+        for key in ('question_image', 'answer_image'):
+            if question.get(key):
+                images[key] = os.path.join(deck_dir, question[key])
+        return images
+    
+    def create_flashcard(self, question, deck_dir):
+        """Build a flashcard from a deck entry, resolving optional figures"""
+        return AnimatedFlashcard(question['question'], question['answer'],
+                                 card_id=question.get('id'), **self.resolve_images(question, deck_dir))
+    
+    def retry_images(self, card):
+        """Give a reloaded card's figures another chance; the file may have been added or fixed"""
+        for path in card.get_images():
+            self.image_cache.retry(path)
+    
+    def apply_deck_changes(self, changes):
+        """Patch the live deck from a DeckChanges diff, keeping position and scores"""
+        for card_id, question in changes.updated.items():
+            card = self.cards_by_id.get(card_id)
+            if card:
+                card.update_content(question['question'], question['answer'],
+                                    **self.resolve_images(question, self.deck_dir))
+                self.retry_images(card)
+        
+        if changes.removed:
+            removed_cards = {id(self.cards_by_id.pop(card_id)) for card_id in changes.removed
+                             if card_id in self.cards_by_id}
+            self.original_flashcards = [c for c in self.original_flashcards if id(c) not in removed_cards]
+            self.flashcards = [c for c in self.flashcards if id(c) not in removed_cards]
+            self.incorrect_cards = [c for c in self.incorrect_cards if id(c) not in removed_cards]
+            # Scores stay as earned; only forget the removed cards' answered flags
+            self.answered_cards -= removed_cards
+        
+        for question in changes.added:
+            card = self.create_flashcard(question, self.deck_dir)
+            self.retry_images(card)
+            self.cards_by_id[card.card_id] = card
+            self.original_flashcards.append(card)
+            if not self.review_mode:
+                self.flashcards.append(card)
+        
+        # Every card under review was deleted, so go back to the full deck
+        if self.review_mode and not self.flashcards:
+            self.back_to_all_cards()
+        # Stay on the same card, or on the same position if it was removed
+        elif self.current_card in self.flashcards:
+            self.current_index = self.flashcards.index(self.current_card)
+        elif self.flashcards:
+            self.current_index = min(self.current_index, len(self.flashcards) - 1)
+            self.current_card = self.flashcards[self.current_index]
+            self.current_card.showing_answer = False
+            self.current_card.flip_state = FlipState.IDLE
         else:
-            for x in range(width):
-                ratio = x / width
-                r = int(color1[0] * (1 - ratio) + color2[0] * ratio)
-                g = int(color1[1] * (1 - ratio) + color2[1] * ratio)
-                b = int(color1[2] * (1 - ratio) + color2[2] * ratio)
-                pygame.draw.line(gradient, (r, g, b), (x, 0), (x, height))
-        return gradient
+            self.current_index = 0
+            self.current_card = None
+    
+    def layout_card_text(self, card, text, base_font, content_width):
+        """Format and wrap a face's text, cached on the card at full card width"""
+        key = (card.showing_answer, content_width)
+        wrapped_lines = card.layout_cache.get(key)
+        if wrapped_lines is None:
+            wrapped_lines = self.wrap_formatted_text(self.format_text(text), base_font, content_width)
+            # Flip animations produce a new width every frame, don't keep those
+            if content_width == self.card_rect.width - 60:
+                card.layout_cache[key] = wrapped_lines
+        return wrapped_lines
+    
+    def get_image_box(self):
+        """Size figures are scaled to: the full content width, unscaled by flips"""
+        available_height = self.card_rect.height - 120
+        return (self.card_rect.width - 60, int(available_height * IMAGE_AREA_RATIO))
+    
+    def prefetch_images(self):
+        """Queue figures for the current and next few cards so they decode ahead of time"""
+        box_size = self.get_image_box()
+        upcoming = self.flashcards[self.current_index:self.current_index + 1 + IMAGE_PREFETCH_AHEAD]
+        for card in upcoming:
+            for path in card.get_images():
+                self.image_cache.request(path, box_size)
+    
+    def draw_card_image(self, path, scaled_rect, scale_x, top, text_color):
+        """Draw the current face's figure centred in the image area"""
+        box_width, box_height = self.get_image_box()
+        image = self.image_cache.get(path, (box_width, box_height))
+        if image is None:
+            if self.image_cache.is_failed(path):
+                return
+            # Still decoding on the worker thread
+            image = font_tiny.render("Loading figure...", True, text_color)
+        
+        if scale_x < 1.0:
+            scaled_width = int(image.get_width() * scale_x)
+            if scaled_width <= 0:
+                return
+            image = pygame.transform.scale(image, (scaled_width, image.get_height()))
+        
+        image_rect = image.get_rect()
+        image_rect.centerx = scaled_rect.centerx
+        image_rect.centery = top + box_height // 2
+        self.screen.blit(image, image_rect)
     
     def format_text(self, text):
         """Format text by processing markdown-style elements"""
@@ -375,9 +585,7 @@ class FlashcardApp:
         shadow_rect = scaled_rect.copy()
         shadow_rect.y += 8
         shadow_rect.x += 4
-        shadow_surface = pygame.Surface((shadow_rect.width, shadow_rect.height), pygame.SRCALPHA)
-        pygame.draw.rect(shadow_surface, (0, 0, 0, 30), shadow_surface.get_rect(), border_radius=24)
-        self.screen.blit(shadow_surface, shadow_rect)
+        blit_rounded_shadow(self.screen, shadow_rect, self.card_rect.size, 24)
         
         # Draw card background
         pygame.draw.rect(self.screen, card_color, scaled_rect, border_radius=24)
@@ -409,15 +617,19 @@ class FlashcardApp:
             content_width = scaled_rect.width - 60
             
             # Format and wrap text
-            formatted_lines = self.format_text(text)
-            wrapped_lines = self.wrap_formatted_text(formatted_lines, base_font, content_width)
+            wrapped_lines = self.layout_card_text(self.current_card, text, base_font, content_width)
             
             # Calculate spacing
             base_line_height = base_font.get_height() + 4
             
-            # Calculate available space for text
+            # Calculate available space for text, leaving room below for a figure
             available_height = scaled_rect.height - 120
-            max_lines = int(available_height / base_line_height)
+            image_path = self.current_card.get_current_image()
+            if image_path and self.image_cache.is_failed(image_path):
+                image_path = None  # Fall back to text only
+            image_height = self.get_image_box()[1] if image_path else 0
+            text_height = available_height - image_height
+            max_lines = int(text_height / base_line_height)
             
             # Truncate if necessary
             display_lines = wrapped_lines[:max_lines] if len(wrapped_lines) > max_lines else wrapped_lines
@@ -425,7 +637,7 @@ class FlashcardApp:
             
             # Calculate total height for centering
             total_height = len(display_lines) * base_line_height
-            start_y = scaled_rect.y + 60 + (available_height - total_height) // 2
+            start_y = scaled_rect.y + 60 + (text_height - total_height) // 2
             
             # Render each formatted line
             for i, (line_type, line_text) in enumerate(display_lines):
@@ -485,8 +697,13 @@ class FlashcardApp:
                 dots_rect.y = start_y + len(display_lines) * base_line_height
                 self.screen.blit(dots_surface, dots_rect)
             
+            # Draw figure
+            if image_path:
+                self.draw_card_image(image_path, scaled_rect, scale_x,
+                                     scaled_rect.y + 60 + text_height, text_color)
+            
             # Draw instruction text
-            if self.current_card.flip_state == FlipState.IDLE:
+            if self.show_card_hints and self.current_card.flip_state == FlipState.IDLE:
                 if not self.current_card.showing_answer:
                     instruction = "Click to reveal answer (Space)"
                 else:
@@ -501,18 +718,15 @@ class FlashcardApp:
     
     def draw_background(self):
         """Draw the modern gradient background"""
-        gradient = self.create_gradient_surface(SCREEN_WIDTH, SCREEN_HEIGHT, 
-                                              COLORS['bg_primary'], COLORS['bg_secondary'])
+        gradient = gradient_surface((SCREEN_WIDTH, SCREEN_HEIGHT),
+                                    COLORS['bg_primary'], COLORS['bg_secondary'])
         self.screen.blit(gradient, (0, 0))
         
-        # Add some subtle pattern
+        # Add some subtle pattern (16px dot with full radius, centred in a 20px cell)
+        dot_surface = rounded_fill((16, 16), (*COLORS['accent'], 20), 8)
         for i in range(0, SCREEN_WIDTH, 100):
             for j in range(0, SCREEN_HEIGHT, 100):
-                alpha = 20
-                color = (*COLORS['accent'], alpha)
-                circle_surface = pygame.Surface((20, 20), pygame.SRCALPHA)
-                pygame.draw.circle(circle_surface, color, (10, 10), 8)
-                self.screen.blit(circle_surface, (i, j))
+                self.screen.blit(dot_surface, (i + 2, j + 2))
     
     def draw_header(self):
         """Draw the modern header"""
@@ -555,8 +769,8 @@ class FlashcardApp:
             progress = (self.current_index + 1) / len(self.flashcards)
             progress_width = int(bar_width * progress)
             if progress_width > 0:
-                gradient_bar = self.create_gradient_surface(progress_width, bar_height, 
-                                                          COLORS['gradient_start'], COLORS['gradient_end'], False)
+                gradient_bar = gradient_surface((progress_width, bar_height),
+                                                COLORS['gradient_start'], COLORS['gradient_end'], False)
                 self.screen.blit(gradient_bar, (bar_x, bar_y))
     
     def draw_score_counters(self):
@@ -630,6 +844,8 @@ class FlashcardApp:
     
     def shuffle_cards(self):
         """Shuffle the cards"""
+        if not self.flashcards:
+            return
         random.shuffle(self.flashcards)
         self.current_index = 0
         self.current_card = self.flashcards[self.current_index]
@@ -667,27 +883,22 @@ class FlashcardApp:
         self.current_index = 0
         self.current_card = self.flashcards[0] if self.flashcards else None
     
+    def flip_current_card(self):
+        """Flip the current card if it isn't already animating"""
+        if self.current_card and self.current_card.flip_state == FlipState.IDLE:
+            self.current_card.start_flip()
+    
+    def update_widget_states(self):
+        """Sync button visibility and enabled flags with the game state"""
+        answered = self.current_card is None or id(self.current_card) in self.answered_cards
+        self.correct_button.enabled = not answered
+        self.incorrect_button.enabled = not answered
+        self.review_button.visible = bool(self.incorrect_cards)  # Only with incorrect answers
+        self.back_to_all_button.visible = self.review_mode  # Only in review mode
+    
     def handle_click(self, pos):
         """Handle mouse clicks"""
-        if self.card_rect.collidepoint(pos) and self.current_card:
-            if self.current_card.flip_state == FlipState.IDLE:
-                self.current_card.start_flip()
-        elif self.next_button.rect.collidepoint(pos):
-            if self.current_index < len(self.flashcards) - 1:
-                self.next_card()
-        elif self.prev_button.rect.collidepoint(pos):
-            if self.current_index > 0:
-                self.prev_card()
-        elif self.shuffle_button.rect.collidepoint(pos):
-            self.shuffle_cards()
-        elif self.correct_button.rect.collidepoint(pos):
-            self.mark_correct()
-        elif self.incorrect_button.rect.collidepoint(pos):
-            self.mark_incorrect()
-        elif self.review_button.rect.collidepoint(pos):
-            self.start_review_mode()
-        elif self.back_to_all_button.rect.collidepoint(pos):
-            self.back_to_all_cards()
+        self.widgets.dispatch_click(pos)
     
     def run(self):
         """Main game loop"""
@@ -708,8 +919,7 @@ class FlashcardApp:
                         self.handle_click(event.pos)
                 elif event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_SPACE:
-                        if self.current_card and self.current_card.flip_state == FlipState.IDLE:
-                            self.current_card.start_flip()
+                        self.flip_current_card()
                     elif event.key == pygame.K_RIGHT or event.key == pygame.K_n:
                         self.next_card()
                     elif event.key == pygame.K_LEFT or event.key == pygame.K_p:
@@ -725,22 +935,21 @@ class FlashcardApp:
                     elif event.key == pygame.K_b:
                         self.back_to_all_cards()
             
+            # Pick up edits to the deck file
+            changes = self.deck_watcher.poll()
+            if changes:
+                self.apply_deck_changes(changes)
+            
             # Update
             self.mouse_pos = pygame.mouse.get_pos()
             self.mouse_pressed = pygame.mouse.get_pressed()[0]
             
             # Update buttons
-            self.prev_button.update(self.mouse_pos, self.mouse_pressed)
-            self.next_button.update(self.mouse_pos, self.mouse_pressed)
-            self.shuffle_button.update(self.mouse_pos, self.mouse_pressed)
+            self.update_widget_states()
+            self.widgets.update(self.mouse_pos, self.mouse_pressed)
             
-            # Only update scoring buttons if current card hasn't been answered
-            if self.current_card and id(self.current_card) not in self.answered_cards:
-                self.correct_button.update(self.mouse_pos, self.mouse_pressed)
-                self.incorrect_button.update(self.mouse_pos, self.mouse_pressed)
-            
-            self.review_button.update(self.mouse_pos, self.mouse_pressed)
-            self.back_to_all_button.update(self.mouse_pos, self.mouse_pressed)
+            # Start decoding figures before they're shown
+            self.prefetch_images()
             
             # Update current card animation
             if self.current_card:
@@ -752,31 +961,8 @@ class FlashcardApp:
             self.draw_card()
             self.draw_score_counters()
             
-            # Draw navigation buttons
-            self.prev_button.draw(self.screen)
-            self.next_button.draw(self.screen)
-            self.shuffle_button.draw(self.screen)
-            
-            # Draw scoring buttons (only if current card hasn't been answered)
-            if self.current_card and id(self.current_card) not in self.answered_cards:
-                self.correct_button.draw(self.screen)
-                self.incorrect_button.draw(self.screen)
-            else:
-                # Draw disabled versions
-                disabled_correct = ModernButton(self.correct_button.rect.x, self.correct_button.rect.y, 
-                                              self.correct_button.rect.width, self.correct_button.rect.height, 
-                                              "Correct", (100, 100, 100), (100, 100, 100), (150, 150, 150))
-                disabled_incorrect = ModernButton(self.incorrect_button.rect.x, self.incorrect_button.rect.y, 
-                                                 self.incorrect_button.rect.width, self.incorrect_button.rect.height, 
-                                                 "Incorrect", (100, 100, 100), (100, 100, 100), (150, 150, 150))
-                disabled_correct.draw(self.screen)
-                disabled_incorrect.draw(self.screen)
-            
-            # Draw mode buttons
-            if self.incorrect_cards:  # Only show review button if there are incorrect answers
-                self.review_button.draw(self.screen)
-            if self.review_mode:  # Only show back button in review mode
-                self.back_to_all_button.draw(self.screen)
+            # Draw buttons (scoring buttons show their disabled state once answered)
+            self.widgets.draw(self.screen)
             
             pygame.display.flip()
             self.clock.tick(FPS)
@@ -784,5 +970,5 @@ class FlashcardApp:
         pygame.quit()
 
 if __name__ == "__main__":
-    app = FlashcardApp()
+    app = FlashcardApp(sys.argv[1] if len(sys.argv) > 1 else 'questions.json')
     app.run() 
\ No newline at end of file
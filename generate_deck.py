@@ -0,0 +1,100 @@
+"""Generate synthetic flashcard decks for scaling tests.
+
+Answers follow the conventions format_text understands: a normal intro
+line, "**Header:**" paragraphs over groups of "•" bullets (some with bold
+terms) and the occasional quoted line, so every format_text line type and
+wrap_formatted_text branch is exercised, as in questions.json.
+
+    python generate_deck.py --cards 100000 --distribution geometric -o deck_100k.json
+"""
+import argparse
+import json
+import random
+
+WORDS = (
+    "software requirements design model process system user client product "
+    "architecture component interface test validation verification release "
+    "iteration sprint backlog story persona scenario class object attribute "
+    "operation inheritance aggregation service quality constraint stakeholder "
+    "maintenance evolution prototype review deployment integration feature"
+).split()
+
+DISTRIBUTIONS = ('uniform', 'geometric', 'fixed')
+
+def sample_bullet_count(rng, distribution, max_bullets):
+    """Number of bullets in one answer"""
+    if distribution == 'fixed':
+        return max_bullets
+    if distribution == 'uniform':
+        return rng.randint(0, max_bullets)
+    # Geometric: mostly short answers with a long tail, like the real deck
+    count = 0
+    while count < max_bullets and rng.random() < 0.6:
+        count += 1
+    return count
+
+def random_sentence(rng, min_words, max_words):
+    words = [rng.choice(WORDS) for _ in range(rng.randint(min_words, max_words))]
+    return ' '.join(words).capitalize()
+
+def generate_card(rng, card_id, distribution, max_bullets, bold_ratio, header_ratio, quote_ratio):
+    """Build one deck entry with the same keys as questions.json"""
+    question = random_sentence(rng, 5, 14) + "?"
+    lines = [random_sentence(rng, 6, 20) + "."]
+    remaining = sample_bullet_count(rng, distribution, max_bullets)
+    while remaining:
+        # Bullets come in groups, often under a standalone bold header like "**Main techniques:**"
+        group_size = min(remaining, rng.randint(1, 3))
+        remaining -= group_size
+        lines.append("")
+        if rng.random() < header_ratio:
+            lines.extend([f"**{random_sentence(rng, 1, 3)}:**", ""])
+        for _ in range(group_size):
+            bullet = random_sentence(rng, 4, 16)
+            if rng.random() < bold_ratio:
+                term = rng.choice(WORDS).capitalize()
+                bullet = f"**{term}:** {bullet}"
+            lines.append(f"• {bullet}")
+    if rng.random() < quote_ratio:
+        lines.extend(["", f'"{random_sentence(rng, 6, 18)}."'])
+    return {"id": card_id, "question": question, "answer": "\n".join(lines)}
+
+def generate_deck(num_cards, distribution='geometric', max_bullets=6, bold_ratio=0.3,
+                  seed=0, header_ratio=0.5, quote_ratio=0.1):
+    """Yield num_cards deck entries; the same arguments always give the same deck"""
+    rng = random.Random(seed)
+    for card_id in range(1, num_cards + 1):
+        yield generate_card(rng, card_id, distribution, max_bullets, bold_ratio, header_ratio, quote_ratio)
+
+def write_deck(path, cards):
+    """Stream entries to a questions.json-style file without holding them all in memory"""
+    with open(path, 'w', encoding='utf-8') as file:
+        file.write('{\n  "questions": [')
+        for i, card in enumerate(cards):
+            file.write(',\n    ' if i else '\n    ')
+            file.write(json.dumps(card, ensure_ascii=False))
+        file.write('\n  ]\n}\n')
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a synthetic flashcard deck")
+    parser.add_argument('--cards', type=int, default=1000, help="number of cards (default: 1000)")
+    parser.add_argument('--distribution', choices=DISTRIBUTIONS, default='geometric',
+                        help="answer length distribution (default: geometric)")
+    parser.add_argument('--max-bullets', type=int, default=6, help="most bullets in one answer (default: 6)")
+    parser.add_argument('--bold-ratio', type=float, default=0.3,
+                        help="share of bullets that start with a **bold** term (default: 0.3)")
+    parser.add_argument('--header-ratio', type=float, default=0.5,
+                        help="share of bullet groups under a **Header:** paragraph (default: 0.5)")
+    parser.add_argument('--quote-ratio', type=float, default=0.1,
+                        help="share of answers ending with a quoted line (default: 0.1)")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('-o', '--output', default='generated_deck.json')
+    args = parser.parse_args()
+
+    write_deck(args.output, generate_deck(args.cards, args.distribution, args.max_bullets,
+                                          args.bold_ratio, args.seed, args.header_ratio,
+                                          args.quote_ratio))
+    print(f"Wrote {args.cards} cards to {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+import pygame
+import threading
+import queue
+from collections import OrderedDict
+
+# Upper bound on decoded pixel data kept around (bytes)
+DEFAULT_CACHE_BYTES = 64 * 1024 * 1024
+
+def fit_size(image_size, box_size):
+    """Largest size with the image's aspect ratio that fits inside box_size"""
+    image_width, image_height = image_size
+    box_width, box_height = box_size
+    if image_width <= 0 or image_height <= 0:
+        return (0, 0)
+    scale = min(box_width / image_width, box_height / image_height)
+    return (max(1, int(image_width * scale)), max(1, int(image_height * scale)))
+
+def to_32bit(image):
+    """Copy 8-bit palette or grayscale images to 32-bit so smoothscale accepts them.
+
+    Blitting onto a fresh SRCALPHA surface keeps palette transparency and,
+    unlike convert_alpha(), works before a display mode is set.
+    """
+    if image.get_bitsize() in (24, 32):
+        return image
+    converted = pygame.Surface(image.get_size(), pygame.SRCALPHA)
+    converted.blit(image, (0, 0))
+    return converted
+
+class ImageCache:
+    """LRU cache of card figures, decoded and scaled on a background thread.
+
+    Surfaces are keyed by (path, box_size). get() never blocks: on a miss it
+    queues the decode and returns None, so the caller can draw a placeholder
+    and pick the figure up on a later frame.
+    """
+    def __init__(self, max_bytes=DEFAULT_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self.surfaces = OrderedDict()
+        self.pending = set()
+        self.failed = set()
+        self.lock = threading.Lock()
+        self.requests = queue.Queue()
+        self.worker = threading.Thread(target=self._worker_loop, daemon=True)
+        self.worker.start()
+
+    def get(self, path, box_size):
+        """Return the scaled surface if ready, otherwise request it and return None"""
+        key = (path, tuple(box_size))
+        with self.lock:
+            surface = self.surfaces.get(key)
+            if surface is not None:
+                self.surfaces.move_to_end(key)
+                return surface
+        self.request(path, box_size)
+        return None
+
+    def request(self, path, box_size):
+        """Queue a decode unless the image is cached, in flight or known broken"""
+        key = (path, tuple(box_size))
+        with self.lock:
+            if key in self.surfaces or key in self.pending or path in self.failed:
+                return
+            self.pending.add(key)
+        self.requests.put(key)
+
+    def is_failed(self, path):
+        with self.lock:
+            return path in self.failed
+
+    def retry(self, path):
+        """Forget an earlier failure so the next request decodes the file again"""
+        with self.lock:
+            self.failed.discard(path)
+
+    def clear(self):
+        with self.lock:
+            self.surfaces.clear()
+            self.total_bytes = 0
+
+    def load(self, path, box_size):
+        """Decode synchronously on the calling thread; for headless rendering"""
+        key = (path, tuple(box_size))
+        with self.lock:
+            if key in self.surfaces:
+                return self.surfaces[key]
+            if path in self.failed:
+                return None
+        return self._decode(key)
+
+    def _worker_loop(self):
+        while True:
+            key = self.requests.get()
+            # One bad file must never take the decode thread down with it
+            try:
+                self._decode(key)
+            except Exception as e:
+                self._mark_failed(key, e)
+
+    def _decode(self, key):
+        path, box_size = key
+        try:
+            image = to_32bit(pygame.image.load(path))
+            size = fit_size(image.get_size(), box_size)
+            if size != image.get_size():
+                image = pygame.transform.smoothscale(image, size)
+        except (pygame.error, OSError, ValueError) as e:
+            self._mark_failed(key, e)
+            return None
+        self._store(key, image)
+        return image
+
+    def _mark_failed(self, key, error):
+        path = key[0]
+        print(f"Error loading image {path}: {error}")
+        with self.lock:
+            self.pending.discard(key)
+            self.failed.add(path)
+
+    def _store(self, key, surface):
+        surface_bytes = surface.get_width() * surface.get_height() * surface.get_bytesize()
+        with self.lock:
+            self.pending.discard(key)
+            self.surfaces[key] = surface
+            self.total_bytes += surface_bytes
+            # Evict least recently used figures, but always keep the newest one
+            while self.total_bytes > self.max_bytes and len(self.surfaces) > 1:
+                _, evicted = self.surfaces.popitem(last=False)
+                self.total_bytes -= evicted.get_width() * evicted.get_height() * evicted.get_bytesize()
@@ -0,0 +1,97 @@
+import pygame
+from functools import lru_cache
+
+# NumPy backs pygame.surfarray; without it we fall back to pygame.draw
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Surfaces returned here are shared cache entries - blit them, never draw on them.
+# Entries are keyed by exact size, so only request fixed sizes; animated widths
+# should go through blit_rounded_shadow instead of growing the cache per frame.
+CACHE_SIZE = 512
+
+def _lerp_colors(color1, color2, steps):
+    """Return a (steps, 3) array blending color1 into color2"""
+    ratio = np.arange(steps, dtype=np.float64)[:, None] / steps
+    start = np.array(color1[:3], dtype=np.float64)
+    end = np.array(color2[:3], dtype=np.float64)
+    # astype truncates like int() did in the old per-line loop
+    return (start * (1 - ratio) + end * ratio).astype(np.uint8)
+
+def _rounded_mask(width, height, radius):
+    """Boolean (width, height) mask of a rectangle with rounded corners"""
+    radius = min(radius, width // 2, height // 2)
+    if radius <= 0:
+        return np.ones((width, height), dtype=bool)
+
+    # Distance of each pixel centre past the straight edges, per axis
+    xs = np.arange(width, dtype=np.float64) + 0.5
+    ys = np.arange(height, dtype=np.float64) + 0.5
+    dx = np.maximum(np.maximum(radius - xs, xs - (width - radius)), 0)
+    dy = np.maximum(np.maximum(radius - ys, ys - (height - radius)), 0)
+    return dx[:, None] ** 2 + dy[None, :] ** 2 <= radius ** 2
+
+@lru_cache(maxsize=CACHE_SIZE)
+def gradient_surface(size, color1, color2, vertical=True):
+    """Linear gradient from color1 to color2, top-to-bottom or left-to-right"""
+    width, height = size
+    if np is None:
+        gradient = pygame.Surface(size)
+        steps = height if vertical else width
+        for i in range(steps):
+            ratio = i / steps
+            color = [int(color1[c] * (1 - ratio) + color2[c] * ratio) for c in range(3)]
+            if vertical:
+                pygame.draw.line(gradient, color, (0, i), (width, i))
+            else:
+                pygame.draw.line(gradient, color, (i, 0), (i, height))
+        return gradient
+
+    if vertical:
+        pixels = np.broadcast_to(_lerp_colors(color1, color2, height)[None, :, :], (width, height, 3))
+    else:
+        pixels = np.broadcast_to(_lerp_colors(color1, color2, width)[:, None, :], (width, height, 3))
+    return pygame.surfarray.make_surface(np.ascontiguousarray(pixels))
+
+@lru_cache(maxsize=CACHE_SIZE)
+def rounded_fill(size, color, radius=0):
+    """Per-pixel-alpha rounded rectangle filled with an RGB or RGBA color"""
+    width, height = size
+    alpha = color[3] if len(color) > 3 else 255
+    surface = pygame.Surface(size, pygame.SRCALPHA)
+    if np is None:
+        pygame.draw.rect(surface, (*color[:3], alpha), surface.get_rect(), border_radius=radius)
+        return surface
+
+    surface.fill((*color[:3], 0))
+    alpha_pixels = pygame.surfarray.pixels_alpha(surface)
+    alpha_pixels[:] = _rounded_mask(width, height, radius) * np.uint8(alpha)
+    del alpha_pixels  # Release the surface lock
+    return surface
+
+def rounded_shadow(size, radius, alpha=30):
+    """Translucent black rounded rectangle used for drop shadows"""
+    return rounded_fill(size, (0, 0, 0, alpha), radius)
+
+def blit_rounded_shadow(target, rect, full_size, radius, alpha=30):
+    """Draw a shadow of rect's size cut from the cached full_size shadow.
+
+    The left and right halves of the full shadow are blitted with clip areas,
+    so narrower widths (e.g. during a card flip) keep their rounded corners
+    without allocating or caching a surface per width.
+    """
+    shadow = rounded_shadow(full_size, radius, alpha)
+    full_width = shadow.get_width()
+    left_width = min(rect.width // 2, full_width)
+    right_width = min(rect.width - left_width, full_width)
+    height = min(rect.height, shadow.get_height())
+    target.blit(shadow, rect.topleft, pygame.Rect(0, 0, left_width, height))
+    target.blit(shadow, (rect.x + left_width, rect.y),
+                pygame.Rect(full_width - right_width, 0, right_width, height))
+
+def clear_cache():
+    """Drop every memoized surface"""
+    gradient_surface.cache_clear()
+    rounded_fill.cache_clear()